@@ -3,16 +3,20 @@ import logging
 import time
 from abc import ABC
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TextIO
 
 logger = logging.getLogger(__name__)
 
 
 class AbstractCSVWriter(ABC):
+    __WRITE_BUFFER_SIZE: int = 1 << 20
+
     def __init__(self, columns_names: List[str]):
         self._csv_file_path: Optional[Path] = None
         self._columns_names: List[str] = columns_names
         self._is_recording: bool = False
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer = None
 
     def start_writing(self, path_to_csv_file: Path) -> float:
         """
@@ -39,14 +43,19 @@ class AbstractCSVWriter(ABC):
             raise RuntimeError('Recording is not started.')
 
         logger.info(f'Stopped writing CSV file: {self._csv_file_path}')
+        self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
         self._csv_file_path = None
         self._is_recording = False
 
     def __create_csv_file(self, path: Path):
         self._csv_file_path = path
-        with self._csv_file_path.open('w', encoding='utf-8') as csv_file:
-            writer = csv.writer(csv_file)
-            writer.writerow(self._columns_names)
+        self._csv_file = self._csv_file_path.open(
+            'w', newline='', encoding='utf-8', buffering=AbstractCSVWriter.__WRITE_BUFFER_SIZE
+        )
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(self._columns_names)
         logger.info(f'Created csv file ({self._csv_file_path}, columns: {self._columns_names}).')
 
     @property
@@ -1,4 +1,3 @@
-import csv
 import logging
 import time
 from pathlib import Path
@@ -42,9 +41,7 @@ class CSVAnnotationsWriter(AbstractCSVWriter):
         :return None:
         """
         if self._is_recording:
-            with self._csv_file_path.open('a', newline='', encoding='utf-8') as csv_file:
-                writer = csv.writer(csv_file)
-                writer.writerow([time.time() - self.__start_time, text])
+            self._csv_writer.writerow([time.time() - self.__start_time, text])
             logger.debug(f'Appended data to csv file (path: {self._csv_file_path})')
         else:
             raise RuntimeError('Recording is not started.')
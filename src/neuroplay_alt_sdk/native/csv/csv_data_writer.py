@@ -1,6 +1,8 @@
-import csv
 import logging
-from typing import Iterable
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Optional
+
+import numpy as np
 
 from .abstract_csv_writer import AbstractCSVWriter
 
@@ -8,6 +10,35 @@ logger = logging.getLogger(__name__)
 
 
 class CSVDataWriter(AbstractCSVWriter):
+    SIDECAR_SUFFIX: str = '.bin'
+
+    __FLUSH_INTERVAL_APPENDS: int = 16
+    __VALUE_FORMAT: str = '%.6g'
+
+    def __init__(self, columns_names: List[str]):
+        super().__init__(columns_names=columns_names)
+        self.__appends_since_flush: int = 0
+        self.__sidecar_file: Optional[BinaryIO] = None
+
+    @staticmethod
+    def sidecar_path_for(csv_file_path: Path) -> Path:
+        """
+        :param csv_file_path: Path to the csv file.
+        :return Path: Path to the binary float32 sidecar written next to the csv file.
+        """
+        return csv_file_path.with_name(csv_file_path.name + CSVDataWriter.SIDECAR_SUFFIX)
+
+    def start_writing(self, path_to_csv_file: Path) -> float:
+        start_time = super().start_writing(path_to_csv_file)
+        self.__sidecar_file = CSVDataWriter.sidecar_path_for(path_to_csv_file).open('wb')
+        return start_time
+
+    def stop_writing(self) -> None:
+        super().stop_writing()
+        if self.__sidecar_file is not None:
+            self.__sidecar_file.close()
+            self.__sidecar_file = None
+
     def append_rows(self, data: Iterable[Iterable]) -> None:
         """
         :param data: Data to be appended to the CSV file.
@@ -15,9 +46,31 @@ class CSVDataWriter(AbstractCSVWriter):
         :return None:
         """
         if self._is_recording:
-            with self._csv_file_path.open('a', newline='', encoding='utf-8') as csv_file:
-                writer = csv.writer(csv_file)
-                writer.writerows(data)
+            rows = data if isinstance(data, np.ndarray) else list(data)
+            self._csv_writer.writerows(rows)
+            self.__sidecar_file.write(np.asarray(rows, dtype=np.float32).tobytes())
+            self.__count_append()
             logger.debug(f'Appended data to csv file (path: {self._csv_file_path})')
         else:
             raise RuntimeError('Recording is not started.')
+
+    def append_ndarray(self, data: np.ndarray) -> None:
+        """
+        :param data: 2D array of rows to be appended to the CSV file.
+        :raises RuntimeError: If recording is not started.
+        :return None:
+        """
+        if self._is_recording:
+            np.savetxt(self._csv_file, data, fmt=CSVDataWriter.__VALUE_FORMAT, delimiter=',')
+            self.__sidecar_file.write(np.ascontiguousarray(data, dtype=np.float32).tobytes())
+            self.__count_append()
+            logger.debug(f'Appended data to csv file (path: {self._csv_file_path})')
+        else:
+            raise RuntimeError('Recording is not started.')
+
+    def __count_append(self) -> None:
+        self.__appends_since_flush += 1
+        if self.__appends_since_flush >= CSVDataWriter.__FLUSH_INTERVAL_APPENDS:
+            self._csv_file.flush()
+            self.__sidecar_file.flush()
+            self.__appends_since_flush = 0
@@ -1,3 +1,4 @@
+import csv
 import logging
 from pathlib import Path
 
@@ -8,6 +9,28 @@ logger = logging.getLogger(__name__)
 
 
 class CSVUtil:
+    @staticmethod
+    def read_header(csv_file_path: Path) -> list[str]:
+        """
+        :param csv_file_path: Path to the csv file.
+        :return list[str]: Column names from the first line, read without a pandas parse.
+        """
+        with csv_file_path.open('r', newline='', encoding='utf-8') as csv_file:
+            return next(csv.reader(csv_file))
+
+    @staticmethod
+    def read_header_and_values(csv_file_path: Path) -> tuple[list[str], np.ndarray]:
+        """
+        :param csv_file_path: Path to the csv file.
+        :return tuple[list[str], np.ndarray]: Column names and transposed column values, read in one pass.
+        """
+        logger.info(f'Reading data from csv file: {csv_file_path}')
+        column_names = CSVUtil.read_header(csv_file_path)
+        values = pd.read_csv(
+            csv_file_path, encoding='utf-8', dtype=np.float32, engine='c', memory_map=True
+        ).to_numpy(copy=False).T
+        return column_names, values
+
     @staticmethod
     def read_columns_values_as_numpy_array(csv_file_path: Path) -> np.ndarray:
         logger.info(f'Reading data from csv file: {csv_file_path}')
@@ -1,8 +1,8 @@
-import asyncio
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Optional, List, Sequence, assert_never
+from collections import deque
+from typing import Optional, Deque, assert_never
 
 import numpy as np
 from bleak import BleakClient, BleakGATTCharacteristic
@@ -15,6 +15,8 @@ from ..exceptions import NeuroPlayExceptionNotValidDevice
 
 logger = logging.getLogger(__name__)
 
+_DEVICE_FULL_NAME_PATTERN = re.compile(r'(.+)\s\((\d+)\)$')
+
 
 class AbstractNeuroPlayDevice(ABC):
     __BLUETOOTH_UUID_EEG: str = "f0001298-0451-4000-b000-000000000000"
@@ -40,10 +42,10 @@ class AbstractNeuroPlayDevice(ABC):
         # TODO: Add the ability to configure the number of channels
         self.__sampling_rate: int = 125
 
-        self.__packets_list: List[bytes] = []
+        self.__packets_list: Deque[bytes] = deque(maxlen=self.__QUEUE_SIZE)
         self.__is_connected: bool = False
 
-        match = re.fullmatch(r'(.+)\s\((\d+)\)$', self.full_name)
+        match = _DEVICE_FULL_NAME_PATTERN.fullmatch(self.full_name)
 
         if not match:
             raise NeuroPlayExceptionNotValidDevice
@@ -55,11 +57,19 @@ class AbstractNeuroPlayDevice(ABC):
         match self.__type:
             case NeuroPlayDevicesEnum.NEUROPLAY_6C:
                 self.channels_names = ["O1", "T3", "Fp1", "Fp2", "T4", "O2"]
+                kept_channels = [0, 2, 3, 4, 5, 7]
             case NeuroPlayDevicesEnum.NEUROPLAY_8CAP:
                 self.channels_names = ["O1", "P3", "C3", "F3", "F4", "C4", "P4", "O2"]
+                kept_channels = [0, 1, 2, 3, 4, 5, 6, 7]
             case _ as unreachable:
                 assert_never(unreachable)
 
+        # Плоские индексы нужных значений в сыром 24-элементном массиве (3 семпла по 8 каналов),
+        # чтобы не удалять лишние каналы через np.delete после декодирования.
+        self.__kept_sample_indices: ndarray = np.array(
+            [sample * 8 + channel for sample in range(3) for channel in kept_channels]
+        )
+
     async def __aenter__(self):
         await self.connect()
         return self
@@ -69,16 +79,16 @@ class AbstractNeuroPlayDevice(ABC):
         self.__packets_list.clear()
 
     @abstractmethod
-    async def raw_channels_data_handler(self, packet: List[float]) -> None:
+    async def raw_channels_data_handler(self, samples: ndarray) -> None:
         pass
 
     @abstractmethod
-    async def filtered_channels_data_handler(self, data: Sequence[float]) -> None:
+    async def filtered_channels_data_handler(self, samples: ndarray) -> None:
         pass
 
     @abstractmethod
-    async def filter_sample_data(self, data: List[float]) -> Sequence[float]:
-        return data
+    async def filter_sample_data(self, samples: ndarray) -> ndarray:
+        return samples
 
     @abstractmethod
     async def on_disconnected(self) -> None:
@@ -92,44 +102,32 @@ class AbstractNeuroPlayDevice(ABC):
             return
 
         if self.__packets_list[0][0] & 0x03:  # Проверяем ID пакета. Он должен быть 0.
-            self.__packets_list.pop(0)  # Только 00 & 11 (0x03) будет выдавать 0.
+            self.__packets_list.popleft()  # Только 00 & 11 (0x03) будет выдавать 0.
             return
 
         # Тут начинается низкоуровневая магия.
-        # Создаём массив из 24 элементов так как у нас будет всего 24 значения.
-        raw_sample_values_array = np.zeros(24, dtype=np.float64)
-
-        # Проходим по пакетам и извлекаем значения.
-        # Берём 4 пакета (__QUEUE_SIZE) по 20 байт (первые 2 байта заголовок).
-        for i, packet in enumerate(self.__packets_list):
-            # Последовательно записываем 6 семплов по 3 бита для каждого из пакетов в raw_sample_values_array
-            for j in range(6):
-                offset = 2 + j * 3
-                val = int.from_bytes(packet[offset:offset + 3] + bytes([0x00]), byteorder='big',
-                                     signed=True) * self.__MAGIC_MICROVOLTS_BIT
-                raw_sample_values_array[i * 6 + j] = val
-
-        # Превращаем массив в матрицу, где chX - данные канала
-        # [ch1, ch2, ch3, ch4, ch5, ch6, ch7, ch8]
-        # [ch1, ch2, ch3, ch4, ch5, ch6, ch7, ch8]
-        # [ch1, ch2, ch3, ch4, ch5, ch6, ch7, ch8]
-        samples_packets: ndarray = raw_sample_values_array.reshape(3, 8)
-
-        #  Удаляем лишние каналы для конкретного устройства
-        match self.__type:
-            case NeuroPlayDevicesEnum.NEUROPLAY_6C:
-                samples_packets = np.delete(samples_packets, [6, 1], axis=1)
-            case NeuroPlayDevicesEnum.NEUROPLAY_8CAP:
-                pass
-            case _ as unreachable:
-                assert_never(unreachable)
-
-        # Отправляем семплы в обработчики
-        for sample in samples_packets:
-            await asyncio.gather(
-                self.raw_channels_data_handler(sample.tolist()),
-                self.filtered_channels_data_handler(await self.filter_sample_data(sample.tolist())),
-            )
+        # Склеиваем полезную нагрузку 4 пакетов (__QUEUE_SIZE) по 18 байт (первые 2 байта заголовок)
+        # и декодируем все 24 значения одной векторной операцией.
+        payload = b''.join(bytes(packet[2:self.__PACKET_SIZE]) for packet in self.__packets_list)
+        raw_bytes = np.frombuffer(payload, dtype=np.uint8).astype(np.int32).reshape(24, 3)
+
+        # Собираем 3-байтовые big-endian значения (с дополнительным нулевым младшим байтом,
+        # как и раньше) в int32: сдвиг на 24 бита ставит знаковый бит на место.
+        raw_sample_values = (raw_bytes[:, 0] << 24) | (raw_bytes[:, 1] << 16) | (raw_bytes[:, 2] << 8)
+        # float32 хватает с запасом: полезных бит всего 24, а полоса памяти вдвое меньше.
+        raw_sample_values_array = raw_sample_values.astype(np.float32) * np.float32(self.__MAGIC_MICROVOLTS_BIT)
+
+        # Выбираем только нужные каналы устройства и превращаем массив в матрицу, где chX - данные канала
+        # [ch1, ch2, ch3, ch4, ch5, ch6]
+        # [ch1, ch2, ch3, ch4, ch5, ch6]
+        # [ch1, ch2, ch3, ch4, ch5, ch6]
+        samples_packets: ndarray = raw_sample_values_array[self.__kept_sample_indices].reshape(
+            3, self.channels_count
+        )
+
+        # Отправляем всю пачку семплов в обработчики одним вызовом, без списков и gather.
+        await self.raw_channels_data_handler(samples_packets)
+        await self.filtered_channels_data_handler(await self.filter_sample_data(samples_packets))
 
         self.__packets_list.clear()
 
@@ -155,10 +153,13 @@ class AbstractNeuroPlayDevice(ABC):
                 logger.error(f"Can't find data service for {self.full_name}")
                 return False
 
-            characteristics_dict = {char.uuid: char for char in self.__data_service.characteristics}
-
-            self.__data_control_characteristic = characteristics_dict.get(self.__BLUETOOTH_UUID_EEG_CONTROL)
-            self.__data_read_characteristic = characteristics_dict.get(self.__BLUETOOTH_UUID_EEG_DATA)
+            self.__data_control_characteristic = None
+            self.__data_read_characteristic = None
+            for characteristic in self.__data_service.characteristics:
+                if characteristic.uuid == self.__BLUETOOTH_UUID_EEG_CONTROL:
+                    self.__data_control_characteristic = characteristic
+                elif characteristic.uuid == self.__BLUETOOTH_UUID_EEG_DATA:
+                    self.__data_read_characteristic = characteristic
 
             if not (self.__data_control_characteristic or self.__data_read_characteristic):
                 logger.error(f"Can't find data or read characteristics for {self.full_name}")
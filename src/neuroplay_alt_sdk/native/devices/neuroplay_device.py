@@ -1,5 +1,5 @@
 import asyncio
-from typing import List, Sequence, Dict
+from typing import Dict
 
 import numpy as np
 from bleak import BLEDevice
@@ -7,7 +7,8 @@ from bleak import BLEDevice
 from .abstract_neuroplay_device import AbstractNeuroPlayDevice
 from ..edf import EDFCreator
 from ..enums import DataStatusEnum
-from ..filters import ContinuousFilter, ContinuousNotchFilter, FiltersContainer
+from ..filters import ContinuousFilter, ContinuousNotchFilter, FiltersContainer, MultiChannelFilterBank
+from ..filters._iir_kernels import NUMBA_AVAILABLE
 from ..utils import DataSynchronizer
 
 
@@ -20,10 +21,13 @@ class NeuroPlayDevice(AbstractNeuroPlayDevice):
             filter_container.add_filter(ContinuousFilter(2, self.sampling_rate, 'high'))
             filter_container.add_filter(ContinuousFilter(40, self.sampling_rate, 'low'))
             filter_container.add_filter(ContinuousNotchFilter(50, self.sampling_rate))
+            filter_container.compile()
             self.__channels_filters.append(filter_container)
+        self.__filter_bank = MultiChannelFilterBank(self.__channels_filters)
         self.__edf_creator = EDFCreator(self.channels_names, self.sampling_rate)
 
-        self.__valid_buffer = []
+        self.__valid_buffer: np.ndarray = np.empty((self.sampling_rate, self.channels_count), dtype=np.float32)
+        self.__valid_buffer_index: int = 0
         self.__accumulating_event = asyncio.Event()
         self.__accumulating_completed = asyncio.Event()
         self.__validate_lock = asyncio.Lock()
@@ -34,24 +38,31 @@ class NeuroPlayDevice(AbstractNeuroPlayDevice):
         self.__data_synchronizer = DataSynchronizer(self.sampling_rate)
         self.__edf_creator.on_start_recording_callables.append(self.__data_synchronizer.reset)
 
-    async def filter_sample_data(self, data: List[float]) -> Sequence[float]:
-        filtered_data = []
-        for f, data in zip(self.__channels_filters, data):
-            filtered_data.append(f.apply_filter(data))
-        return filtered_data
+    async def filter_sample_data(self, samples: np.ndarray) -> np.ndarray:
+        if NUMBA_AVAILABLE:
+            # Ядро фильтра отпускает GIL, поэтому фильтрацию можно увести в поток,
+            # не блокируя приём BLE-нотификаций в основном event loop.
+            return await asyncio.to_thread(self.__filter_samples, samples)
+        return self.__filter_samples(samples)
 
-    async def raw_channels_data_handler(self, data: List[float]) -> None:
+    def __filter_samples(self, samples: np.ndarray) -> np.ndarray:
+        filtered_samples = self.__filter_bank.filter_block(samples.T)
+        return filtered_samples.T.astype(samples.dtype, copy=False)
+
+    async def raw_channels_data_handler(self, samples: np.ndarray) -> None:
         pass
 
-    async def filtered_channels_data_handler(self, data: Sequence[float]) -> None:
-        if self.__edf_creator.is_recording:
-            for timed_data in self.__data_synchronizer.synchronize_data(data):
-                self.__edf_creator.write_data(np.array(timed_data))
+    async def filtered_channels_data_handler(self, samples: np.ndarray) -> None:
+        for data in samples:
+            if self.__edf_creator.is_recording:
+                for timed_data in self.__data_synchronizer.iter_synchronized(data):
+                    self.__edf_creator.write_data(np.asarray(timed_data, dtype=np.float32))
 
-        if self.__accumulating_event.is_set():
-            self.__valid_buffer.append(data)
-            if len(self.__valid_buffer) >= self.sampling_rate:
-                await self.__complete_accumulation()
+            if self.__accumulating_event.is_set():
+                self.__valid_buffer[self.__valid_buffer_index] = data
+                self.__valid_buffer_index += 1
+                if self.__valid_buffer_index >= self.sampling_rate:
+                    await self.__complete_accumulation()
 
     async def on_disconnected(self) -> None:
         self.__data_synchronizer.reset()
@@ -83,14 +94,9 @@ class NeuroPlayDevice(AbstractNeuroPlayDevice):
             return data
 
     async def __validate_channels_data_from_buffer(self) -> dict[str, DataStatusEnum]:
-        valid_array = np.array(self.__valid_buffer).T
-
-        max_deviations = []
+        valid_array = self.__valid_buffer[:self.__valid_buffer_index].T
 
-        for i in range(valid_array.shape[0]):
-            max_value = np.max(valid_array[i])
-            min_value = np.min(valid_array[i])
-            max_deviations.append(max(abs(max_value), abs(min_value)))
+        max_deviations = np.abs(valid_array).max(axis=1)
 
         return {
             channel: (
@@ -109,7 +115,7 @@ class NeuroPlayDevice(AbstractNeuroPlayDevice):
         self.__accumulating_event.set()
 
     def __reset_accumulation(self) -> None:
-        self.__valid_buffer.clear()
+        self.__valid_buffer_index = 0
         self.__accumulating_completed.clear()
         self.__accumulating_event.clear()
 
@@ -20,7 +20,8 @@ class EDFCreator:
         self.__sample_frequency = sampling_rate
         self.__csv_data_writer: CSVDataWriter = CSVDataWriter(columns_names=channels_names)
         self.__csv_annotations_writer: CSVAnnotationsWriter = CSVAnnotationsWriter()
-        self.__buffer = []
+        self.__buffer: np.ndarray = np.empty((sampling_rate, len(channels_names)), dtype=np.float32)
+        self.__buffer_index: int = 0
 
         self.__path_to_edf: Optional[Path] = None
         self.__path_to_data_csv: Optional[Path] = None
@@ -64,9 +65,9 @@ class EDFCreator:
         for call in self.__on_stop_recording_callables:
             call()
 
-        if self.__buffer:
-            self.__csv_data_writer.append_rows(self.__buffer)
-            self.__buffer.clear()
+        if self.__buffer_index:
+            self.__csv_data_writer.append_ndarray(self.__buffer[:self.__buffer_index])
+            self.__buffer_index = 0
 
         self.__csv_annotations_writer.stop_writing()
         self.__csv_data_writer.stop_writing()
@@ -110,7 +111,13 @@ class EDFCreator:
         :raises ValueError: Raises if pandas cannot convert time to float or text to str.
         :return None:
         """
-        column_names = CSVUtil.get_column_names(file_path_csv_data)
+        sidecar_path = CSVDataWriter.sidecar_path_for(file_path_csv_data)
+
+        if sidecar_path.exists() and sidecar_path.stat().st_size:
+            column_names = CSVUtil.read_header(file_path_csv_data)
+            data = np.memmap(sidecar_path, dtype=np.float32, mode='r').reshape(-1, len(column_names)).T
+        else:
+            column_names, data = CSVUtil.read_header_and_values(file_path_csv_data)
 
         edf_writer = EdfWriter(
             str(file_path_edf),
@@ -129,8 +136,6 @@ class EDFCreator:
                 'digital_max': 32767,
             })
 
-        data = CSVUtil.read_columns_values_as_numpy_array(file_path_csv_data)
-
         logger.info(f'Writing data to EDF file: {file_path_csv_data} -> {file_path_edf}')
         edf_writer.writeSamples(data)
         logger.info(f'Data is wrote to EDF file: {file_path_csv_data} -> {file_path_edf}')
@@ -147,20 +152,21 @@ class EDFCreator:
             except ValueError:
                 raise ValueError("Cannot convert time to float or text to str.")
 
-            for index, row in df.iterrows():
-                annotation_time = float(row['time'])
-                annotation_text = str(row['text'])
+            annotation_times = df['time'].to_numpy(np.float64, copy=False)
+            annotation_texts = df['text'].to_numpy(object, copy=False)
 
-                edf_writer.writeAnnotation(annotation_time, 0, annotation_text)
+            for annotation_time, annotation_text in zip(annotation_times, annotation_texts):
+                edf_writer.writeAnnotation(float(annotation_time), 0, str(annotation_text))
 
         edf_writer.close()
 
     def write_data(self, data: np.ndarray):
-        self.__buffer.append(data)
+        self.__buffer[self.__buffer_index] = data
+        self.__buffer_index += 1
 
-        if len(self.__buffer) >= self.__sample_frequency:
-            self.__csv_data_writer.append_rows(self.__buffer)
-            self.__buffer.clear()
+        if self.__buffer_index >= self.__sample_frequency:
+            self.__csv_data_writer.append_ndarray(self.__buffer)
+            self.__buffer_index = 0
 
     @property
     def is_recording(self) -> bool:
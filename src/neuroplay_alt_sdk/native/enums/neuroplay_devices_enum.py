@@ -6,10 +6,10 @@ class NeuroPlayDevicesEnum(Enum):
     NEUROPLAY_6C = "NeuroPlay-6C"
     NEUROPLAY_8CAP = "NeuroPlay-8Cap"
     __UNDEFINED = ""
+    __VALUE_TO_MEMBER = {}
 
     @classmethod
     def from_string(cls, device_name: str) -> 'NeuroPlayDevicesEnum':
-        for device in NeuroPlayDevicesEnum:
-            if device.value == device_name:
-                return device
-        return cls.__UNDEFINED
+        if not cls.__VALUE_TO_MEMBER:
+            cls.__VALUE_TO_MEMBER.update({member.value: member for member in cls})
+        return cls.__VALUE_TO_MEMBER.get(device_name, cls.__UNDEFINED)
@@ -3,9 +3,11 @@ __all__ = [
     'ContinuousFilter',
     'ContinuousNotchFilter',
     'FiltersContainer',
+    'MultiChannelFilterBank',
 ]
 
 from .abstract_filter import AbstractFilter
 from .continuous_filter import ContinuousFilter
 from .continuous_notch_filter import ContinuousNotchFilter
 from .filters_container import FiltersContainer
+from .multi_channel_filter_bank import MultiChannelFilterBank
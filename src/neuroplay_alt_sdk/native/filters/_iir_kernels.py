@@ -0,0 +1,73 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    njit = None
+    prange = range
+    NUMBA_AVAILABLE: bool = False
+
+
+def _iir_step_df2t(b: np.ndarray, a: np.ndarray, zi: np.ndarray, x: float) -> float:
+    """
+    Single Direct-Form-II-Transposed IIR step.
+
+    :param b: Numerator coefficients, normalized so that a[0] == 1 (same length as 'a').
+    :param a: Denominator coefficients, normalized so that a[0] == 1.
+    :param zi: Delay-line state, updated in place.
+    :param x: Input sample.
+    :return float: Filtered sample.
+    """
+    y = b[0] * x + zi[0]
+    n = zi.shape[0]
+    for i in range(n - 1):
+        zi[i] = b[i + 1] * x + zi[i + 1] - a[i + 1] * y
+    zi[n - 1] = b[n] * x - a[n] * y
+    return y
+
+
+def _sos_filter_multi(sos: np.ndarray, zi: np.ndarray, x: np.ndarray, y: np.ndarray) -> None:
+    """
+    Multichannel cascaded-biquad (second-order sections) filter, DF2T per section.
+
+    :param sos: (channels, sections, 6) coefficient array with a0 == 1 per section.
+    :param zi: (channels, sections, 2) delay-line state, updated in place.
+    :param x: (channels, samples) input block.
+    :param y: (channels, samples) output block, written in place.
+    :return None:
+    """
+    n_channels, n_samples = x.shape
+    n_sections = sos.shape[1]
+    for c in prange(n_channels):
+        for n in range(n_samples):
+            value = x[c, n]
+            for s in range(n_sections):
+                b0 = sos[c, s, 0]
+                b1 = sos[c, s, 1]
+                b2 = sos[c, s, 2]
+                a1 = sos[c, s, 4]
+                a2 = sos[c, s, 5]
+                out = b0 * value + zi[c, s, 0]
+                zi[c, s, 0] = b1 * value + zi[c, s, 1] - a1 * out
+                zi[c, s, 1] = b2 * value - a2 * out
+                value = out
+            y[c, n] = value
+
+
+if NUMBA_AVAILABLE:
+    iir_step_df2t = njit(cache=True, nogil=True, fastmath=True)(_iir_step_df2t)
+    sos_filter_multi = njit(parallel=True, cache=True, nogil=True, fastmath=True)(_sos_filter_multi)
+    # Warm the JIT once at import so the first real sample does not pay the compile cost.
+    iir_step_df2t(np.array([1.0, 0.0]), np.array([1.0, 0.0]), np.zeros(1), 0.0)
+    sos_filter_multi(np.zeros((1, 1, 6)), np.zeros((1, 1, 2)), np.zeros((1, 1)), np.empty((1, 1)))
+    logger.debug('Numba is available, IIR filters will use the JIT-compiled kernels.')
+else:
+    iir_step_df2t = _iir_step_df2t
+    sos_filter_multi = _sos_filter_multi
+    logger.debug('Numba is not available, IIR filters will use the pure-Python kernels.')
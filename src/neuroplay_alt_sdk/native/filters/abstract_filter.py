@@ -1,7 +1,13 @@
-from abc import abstractmethod, ABC
+import numpy as np
 
 
-class AbstractFilter(ABC):
-    @abstractmethod
+class AbstractFilter:
     def apply_filter(self, data_sample):
-        return data_sample
+        raise NotImplementedError
+
+    def apply_filter_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        :param block: 1D block of consecutive samples.
+        :return np.ndarray: Filtered block. Subclasses should override this with a vectorized version.
+        """
+        return np.asarray([self.apply_filter(data_sample) for data_sample in block])
@@ -1,17 +1,61 @@
+from functools import lru_cache
+
 import numpy as np
 from scipy.signal import butter, lfilter
 
+from ._iir_kernels import iir_step_df2t
 from .abstract_filter import AbstractFilter
 
 
+@lru_cache(maxsize=128)
+def _design_butter(order: int, wn: float, btype: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    :return tuple: Read-only (b, a, sos) arrays for the given Butterworth design, cached per parameters.
+    """
+    b, a = butter(order, wn, btype)
+    sos = butter(order, wn, btype, output='sos')
+    b.setflags(write=False)
+    a.setflags(write=False)
+    sos.setflags(write=False)
+    return b, a, sos
+
+
 class ContinuousFilter(AbstractFilter):
     def __init__(self, cutoff, fs, btype, order=5):
         self.cutoff = cutoff
         self.fs = fs
         self.order = order
-        self.b, self.a = butter(self.order, self.cutoff / (0.5 * fs), btype)
-        self.zi = np.zeros(max(len(self.a), len(self.b)) - 1)
+        b, a, self.sos = _design_butter(self.order, self.cutoff / (0.5 * fs), btype)
+        a0 = a[0]
+        self.b = np.ascontiguousarray(b / a0, dtype=np.float64)
+        self.a = np.ascontiguousarray(a / a0, dtype=np.float64)
+        self.zi = np.zeros(max(len(self.a), len(self.b)) - 1, dtype=np.float64)
+        if len(self.a) == 3 and len(self.b) == 3:
+            # Second-order designs collapse to a fixed-length biquad recurrence;
+            # bind it directly so per-sample calls skip the generic kernel.
+            # Coefficients and state are kept as plain floats to avoid numpy
+            # scalar indexing in the per-sample path.
+            self._b0, self._b1, self._b2 = map(float, self.b)
+            self._a1, self._a2 = float(self.a[1]), float(self.a[2])
+            self._z0 = .0
+            self._z1 = .0
+            self.apply_filter = self._apply_biquad
+            self.apply_filter_block = self._apply_biquad_block
 
     def apply_filter(self, data_sample):
-        filtered_sample, self.zi = lfilter(self.b, self.a, [data_sample], zi=self.zi)
-        return filtered_sample[0]
+        return iir_step_df2t(self.b, self.a, self.zi, data_sample)
+
+    def _apply_biquad(self, data_sample):
+        filtered_sample = self._b0 * data_sample + self._z0
+        self._z0 = self._b1 * data_sample + self._z1 - self._a1 * filtered_sample
+        self._z1 = self._b2 * data_sample - self._a2 * filtered_sample
+        return filtered_sample
+
+    def _apply_biquad_block(self, block: np.ndarray) -> np.ndarray:
+        zi = np.array([self._z0, self._z1], dtype=np.float64)
+        filtered_block, (self._z0, self._z1) = lfilter(self.b, self.a, block, zi=zi)
+        return filtered_block
+
+    def apply_filter_block(self, block: np.ndarray) -> np.ndarray:
+        filtered_block, self.zi = lfilter(self.b, self.a, block, zi=self.zi)
+        return filtered_block
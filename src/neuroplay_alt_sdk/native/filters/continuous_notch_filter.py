@@ -1,18 +1,62 @@
+from functools import lru_cache
+
 import numpy as np
-from scipy.signal import lfilter, iirnotch
+from scipy.signal import iirnotch, lfilter, tf2sos
 
+from ._iir_kernels import iir_step_df2t
 from .abstract_filter import AbstractFilter
 
 
+@lru_cache(maxsize=128)
+def _design_notch(w0: float, quality_factor: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    :return tuple: Read-only (b, a, sos) arrays for the given notch design, cached per parameters.
+    """
+    b, a = iirnotch(w0=w0, Q=quality_factor)
+    sos = tf2sos(b, a)
+    b.setflags(write=False)
+    a.setflags(write=False)
+    sos.setflags(write=False)
+    return b, a, sos
+
+
 class ContinuousNotchFilter(AbstractFilter):
     def __init__(self, notch_freq, fs, quality_factor=30, order=2):
         self.notch_freq = notch_freq
         self.quality_factor = quality_factor
         self.fs = fs
         self.order = order
-        self.b, self.a = iirnotch(w0=self.notch_freq / (0.5 * fs), Q=self.quality_factor)
-        self.zi = np.zeros(max(len(self.a), len(self.b)) - 1)
+        b, a, self.sos = _design_notch(self.notch_freq / (0.5 * fs), self.quality_factor)
+        a0 = a[0]
+        self.b = np.ascontiguousarray(b / a0, dtype=np.float64)
+        self.a = np.ascontiguousarray(a / a0, dtype=np.float64)
+        self.zi = np.zeros(max(len(self.a), len(self.b)) - 1, dtype=np.float64)
+        if len(self.a) == 3 and len(self.b) == 3:
+            # iirnotch always yields a biquad; bind the fixed-length recurrence
+            # so per-sample calls skip the generic kernel. Coefficients and
+            # state are kept as plain floats to avoid numpy scalar indexing
+            # in the per-sample path.
+            self._b0, self._b1, self._b2 = map(float, self.b)
+            self._a1, self._a2 = float(self.a[1]), float(self.a[2])
+            self._z0 = .0
+            self._z1 = .0
+            self.apply_filter = self._apply_biquad
+            self.apply_filter_block = self._apply_biquad_block
 
     def apply_filter(self, data_sample):
-        filtered_sample, self.zi = lfilter(self.b, self.a, [data_sample], zi=self.zi)
-        return filtered_sample[0]
+        return iir_step_df2t(self.b, self.a, self.zi, data_sample)
+
+    def _apply_biquad(self, data_sample):
+        filtered_sample = self._b0 * data_sample + self._z0
+        self._z0 = self._b1 * data_sample + self._z1 - self._a1 * filtered_sample
+        self._z1 = self._b2 * data_sample - self._a2 * filtered_sample
+        return filtered_sample
+
+    def _apply_biquad_block(self, block: np.ndarray) -> np.ndarray:
+        zi = np.array([self._z0, self._z1], dtype=np.float64)
+        filtered_block, (self._z0, self._z1) = lfilter(self.b, self.a, block, zi=zi)
+        return filtered_block
+
+    def apply_filter_block(self, block: np.ndarray) -> np.ndarray:
+        filtered_block, self.zi = lfilter(self.b, self.a, block, zi=self.zi)
+        return filtered_block
@@ -1,4 +1,7 @@
-from typing import List
+from typing import Callable, List, Optional
+
+import numpy as np
+from scipy.signal import sosfilt
 
 from .abstract_filter import AbstractFilter
 
@@ -9,15 +12,58 @@ class FiltersContainer(AbstractFilter):
             filters = []
 
         self.__filters = filters
+        self.__apply_fns: List[Callable] = [f.apply_filter for f in filters]
+        self.__apply_block_fns: List[Callable] = [f.apply_filter_block for f in filters]
+        self.__sos: Optional[np.ndarray] = None
+        self.__sos_zi: Optional[np.ndarray] = None
 
     def add_filter(self, f: AbstractFilter):
         self.__filters.append(f)
+        self.__apply_fns.append(f.apply_filter)
+        self.__apply_block_fns.append(f.apply_filter_block)
+        self.__invalidate_compiled()
 
     def clear_filters(self):
         self.__filters.clear()
+        self.__apply_fns.clear()
+        self.__apply_block_fns.clear()
+        self.__invalidate_compiled()
+
+    def compile(self) -> None:
+        """
+        Stacks the second-order sections of every stored filter into one sos array,
+        so apply_filter_block runs a single sosfilt call instead of one call per filter.
+        :raises AttributeError: If a stored filter does not expose second-order sections.
+        :return None:
+        """
+        self.__sos = np.vstack([f.sos for f in self.__filters])
+        self.__sos_zi = np.zeros((self.__sos.shape[0], 2), dtype=np.float64)
+
+    @property
+    def sos(self) -> np.ndarray:
+        """
+        Combined second-order sections of the stored filters, compiled on first access.
+        """
+        if self.__sos is None:
+            self.compile()
+        return self.__sos
 
     def apply_filter(self, data: float):
-        for f in self.__filters:
-            data = f.apply_filter(data)
+        for fn in self.__apply_fns:
+            data = fn(data)
 
         return data
+
+    def apply_filter_block(self, block: np.ndarray) -> np.ndarray:
+        if self.__sos is not None:
+            block, self.__sos_zi = sosfilt(self.__sos, block, zi=self.__sos_zi)
+            return block
+
+        for fn in self.__apply_block_fns:
+            block = fn(block)
+
+        return block
+
+    def __invalidate_compiled(self) -> None:
+        self.__sos = None
+        self.__sos_zi = None
@@ -0,0 +1,48 @@
+from typing import List
+
+import numpy as np
+from scipy.signal import sosfilt
+
+from ._iir_kernels import NUMBA_AVAILABLE, sos_filter_multi
+from .filters_container import FiltersContainer
+
+
+class MultiChannelFilterBank:
+    def __init__(self, filters_containers: List[FiltersContainer]):
+        """
+        :param filters_containers: One FiltersContainer per channel; all must compile
+            to the same number of second-order sections.
+        :raises ValueError: If the containers have different numbers of sections.
+        """
+        sos_per_channel = [filters_container.sos for filters_container in filters_containers]
+
+        if len({sos.shape[0] for sos in sos_per_channel}) != 1:
+            raise ValueError('All channels must have the same number of second-order sections.')
+
+        self.__sos: np.ndarray = np.ascontiguousarray(np.stack(sos_per_channel), dtype=np.float64)
+        self.__zi: np.ndarray = np.zeros((self.__sos.shape[0], self.__sos.shape[1], 2), dtype=np.float64)
+
+    def filter_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        :param block: (channels, samples) matrix.
+        :return np.ndarray: Filtered float64 matrix of the same shape.
+        """
+        x = np.ascontiguousarray(block, dtype=np.float64)
+        filtered_block = np.empty_like(x)
+
+        if NUMBA_AVAILABLE:
+            sos_filter_multi(self.__sos, self.__zi, x, filtered_block)
+        else:
+            for channel in range(x.shape[0]):
+                filtered_block[channel], self.__zi[channel] = sosfilt(
+                    self.__sos[channel], x[channel], zi=self.__zi[channel]
+                )
+
+        return filtered_block
+
+    def reset(self) -> None:
+        self.__zi[:] = .0
+
+    @property
+    def channels_count(self) -> int:
+        return self.__sos.shape[0]
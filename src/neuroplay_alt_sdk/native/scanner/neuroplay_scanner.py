@@ -39,9 +39,12 @@ class NeuroPlayScanner(AsyncGenerator[T, None]):
 
         self.__timeout = timeout
         self.__devices_names = devices_names
+        self.__names_prefixes: tuple[str, ...] = tuple(name.value for name in devices_names)
         self.__discovered_devices: Dict[str, T] = {}
-        self.__scanner: BleakScanner = BleakScanner()
-        self.__generator: AsyncGenerator[BLEDevice, None] = self.__discover_generator()
+        self.__discovered_devices_list: List[T] = []
+        self.__discovered_addresses: Set[str] = set()
+        self.__scanner: BleakScanner = BleakScanner(detection_callback=self.__on_detect)
+        self.__match_future: Optional[asyncio.Future] = None
         self.__device_class = device_class
 
     async def __aenter__(self) -> 'NeuroPlayScanner':
@@ -61,17 +64,21 @@ class NeuroPlayScanner(AsyncGenerator[T, None]):
         except asyncio.TimeoutError:
             raise StopAsyncIteration
 
-    async def __discover_generator(self) -> AsyncGenerator[BLEDevice, None]:
-        async for ble_device, _ in self.__scanner.advertisement_data():
-            yield ble_device
+    def __on_detect(self, ble_device: BLEDevice, _advertisement_data) -> None:
+        """
+        Synchronous detection callback invoked by bleak for every advertisement;
+        resolves the pending discovery future on the first valid device.
+        """
+        future = self.__match_future
+        if future is not None and not future.done() and self.__is_valid_device(ble_device):
+            future.set_result(ble_device)
 
     def __is_valid_device(self, ble_device: BLEDevice) -> bool:
         device_name = ble_device.name
-        device_address = ble_device.address
 
-        return (device_name
-                and any(name.value in device_name for name in self.__devices_names)
-                and device_address not in self.__discovered_devices)
+        return (device_name is not None
+                and device_name.startswith(self.__names_prefixes)
+                and ble_device.address not in self.__discovered_addresses)
 
     async def discover_next(self, timeout: Optional[int] = None) -> T:
         """
@@ -83,41 +90,47 @@ class NeuroPlayScanner(AsyncGenerator[T, None]):
         :return: An instance of the device class for the first valid device found.
         """
         timeout = timeout or self.__timeout
+        self.__match_future = asyncio.get_running_loop().create_future()
 
         try:
-            async with asyncio.timeout(timeout):
-                async for ble_device in self.__generator:
-                    if self.__is_valid_device(ble_device):
-                        logger.info(f"Found {ble_device.name} ({ble_device.address})")
-
-                        neuroplay_device = self.__device_class(ble_device)
-                        self.__discovered_devices[ble_device.address] = neuroplay_device
-
-                        return neuroplay_device
+            ble_device = await asyncio.wait_for(self.__match_future, timeout)
         except asyncio.TimeoutError as e:
             logger.info(f"Timeout reached ({timeout}s)., stop discovering.")
             raise e
+        finally:
+            self.__match_future = None
+
+        logger.info(f"Found {ble_device.name} ({ble_device.address})")
+
+        neuroplay_device = self.__device_class(ble_device)
+        self.__discovered_devices[ble_device.address] = neuroplay_device
+        self.__discovered_devices_list.append(neuroplay_device)
+        self.__discovered_addresses.add(ble_device.address)
+
+        return neuroplay_device
 
     @staticmethod
     async def search_for(device_type: NeuroPlayDevicesEnum,
                          device_id: int,
                          device_class: Type[T] = NeuroPlayDevice,
                          timeout: int = 5) -> Optional[T]:
-        pattern = rf'^{re.escape(device_type.value)}.* \({device_id}\)$'
+        pattern = re.compile(rf'^{re.escape(device_type.value)}.* \({device_id}\)$')
 
         async with NeuroPlayScanner(devices_names={device_type}, timeout=timeout, device_class=device_class) as scanner:
             async for device in scanner:
-                if re.match(pattern, device.full_name):
+                if pattern.match(device.full_name):
                     return device
 
         return None
 
     @property
     def discovered_devices(self) -> List[T]:
-        return list(self.__discovered_devices.values())
+        return self.__discovered_devices_list
 
     def clear_discovered_devices(self) -> None:
         self.__discovered_devices.clear()
+        self.__discovered_devices_list.clear()
+        self.__discovered_addresses.clear()
 
     async def start(self) -> None:
         await self.__scanner.start()
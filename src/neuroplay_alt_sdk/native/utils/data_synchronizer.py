@@ -1,33 +1,44 @@
 import time
-from typing import Optional, Sequence
+from typing import Iterator, Optional, Sequence
 
 
 class DataSynchronizer:
     def __init__(self, sampling_rate: int = 125):
         self.__first_run: bool = True
-        self.__expected_time_limit: Optional[float] = None
-        self.__interval: float = 1 / sampling_rate
-
-    def synchronize_data(self, data: Sequence[float]) -> list[Sequence[float]]:
-        current_time = time.perf_counter()
+        self.__expected_time_limit_ns: Optional[int] = None
+        self.__interval_ns: int = 1_000_000_000 // sampling_rate
+        self.__zero_row: tuple[float, ...] = ()
+
+    def iter_synchronized(self, data: Sequence[float]) -> Iterator[Sequence[float]]:
+        """
+        :param data: Sample to be synchronized.
+        :return Iterator[Sequence[float]]: Zero-fill rows for every missed tick, then the sample itself.
+            The zero rows are a shared tuple and must be treated as read-only.
+        """
+        current_time_ns = time.monotonic_ns()
 
         if self.__first_run:
             self.__first_run = False
-            self.__expected_time_limit = time.perf_counter()
+            self.__expected_time_limit_ns = current_time_ns
+
+        self.__expected_time_limit_ns += self.__interval_ns
 
-        self.__expected_time_limit += self.__interval
-        buffer: list[Sequence[float]] = []
+        if self.__expected_time_limit_ns < current_time_ns:
+            lag_ns = current_time_ns - self.__expected_time_limit_ns
+            missed = (lag_ns + self.__interval_ns - 1) // self.__interval_ns
+            self.__expected_time_limit_ns += missed * self.__interval_ns
 
-        if self.__expected_time_limit >= current_time:
-            buffer.append(data)
-        else:
-            while self.__expected_time_limit < current_time:
-                self.__expected_time_limit += self.__interval
-                buffer.append([.0] * len(data))
-            buffer.append(data)
+            if len(self.__zero_row) != len(data):
+                self.__zero_row = (.0,) * len(data)
 
-        return buffer
+            for _ in range(missed):
+                yield self.__zero_row
+
+        yield data
+
+    def synchronize_data(self, data: Sequence[float]) -> list[Sequence[float]]:
+        return list(self.iter_synchronized(data))
 
     def reset(self):
         self.__first_run = True
-        self.__expected_time_limit = None
+        self.__expected_time_limit_ns = None
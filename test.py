@@ -22,7 +22,7 @@ async def main():
 
     await asyncio.sleep(2)
 
-    start_time = time.perf_counter()
+    start_time = time.monotonic_ns()
 
     device.edf_creator.start_recording(Path('.') / 'test.edf')
 
@@ -30,11 +30,11 @@ async def main():
 
     device.edf_creator.stop_recording()
 
-    end_time = time.perf_counter()
+    end_time = time.monotonic_ns()
 
     await device.disconnect()
 
-    print(end_time - start_time)
+    print((end_time - start_time) / 1e9)
 
 
 if __name__ == '__main__':